@@ -0,0 +1,119 @@
+"""
+Asynchronous counterpart to SqlExecuter, backed by psycopg 3.
+
+Requires the optional psycopg and psycopg_pool packages.  Each query checks its own
+connection out of a shared AsyncConnectionPool, so many queries can overlap their I/O
+wait on one event loop instead of blocking a thread per connection.
+
+Example usage:
+    from database.async_executer import async_connect_to_db
+    sql_executer = await async_connect_to_db('decoded', 'etl')
+    results = await sql_executer.fetch_all_rows(
+        "select column_a from table where column_b = %(column_b)s", dict(column_b='foo')
+    )
+"""
+from asyncio import Lock
+from os import environ
+
+from psycopg.rows import namedtuple_row
+from psycopg_pool import AsyncConnectionPool
+
+from .connector import PostgresDbConnector
+from .sql_executer import ExecutionResults, FETCH_ONE, FETCH_ALL, MODIFY
+
+ASYNC_POOL_MIN_CONNECTIONS = int(environ.get('PG_ASYNC_POOL_MIN_CONNECTIONS', 1))
+ASYNC_POOL_MAX_CONNECTIONS = int(environ.get('PG_ASYNC_POOL_MAX_CONNECTIONS', 10))
+
+_ASYNC_POOLS = {}
+_ASYNC_POOLS_LOCK = Lock()
+
+
+async def _get_async_pool(pool_key, connection_alias):
+    """
+    Retrieve (or lazily create and open) the shared async pool for a set of credentials.
+
+    :param pool_key: tuple of (db_name, user_name, environment) identifying the pool
+    :param connection_alias: pg_service connection string used to open new connections
+    :return: an open AsyncConnectionPool for the given credentials
+    """
+    async with _ASYNC_POOLS_LOCK:
+        connection_pool = _ASYNC_POOLS.get(pool_key)
+        if connection_pool is None:
+            connection_pool = AsyncConnectionPool(
+                connection_alias,
+                min_size=ASYNC_POOL_MIN_CONNECTIONS,
+                max_size=ASYNC_POOL_MAX_CONNECTIONS,
+                kwargs=dict(row_factory=namedtuple_row, autocommit=True),
+                open=False,
+            )
+            await connection_pool.open()
+            _ASYNC_POOLS[pool_key] = connection_pool
+
+    return connection_pool
+
+
+class AsyncSqlExecuter(object):
+    """
+    Async convenience methods for commonly used database activities.
+
+    Mirrors the SqlExecuter read/write interface, but every call checks a connection
+    out of the pool for just its own duration, so one executer can safely serve many
+    concurrent queries.
+    """
+    def __init__(self, connection_pool):
+        self.connection_pool = connection_pool
+
+    async def _execute(self, sql, args, execution_type):
+        """
+        Execute a statement on a pooled connection and fetch per the execution type.
+        """
+        async with self.connection_pool.connection() as db_connection:
+            async with db_connection.cursor() as cursor:
+                await cursor.execute(sql, args)
+                if execution_type == FETCH_ONE:
+                    query_data = await cursor.fetchone()
+                elif execution_type == FETCH_ALL:
+                    query_data = await cursor.fetchall()
+                else:
+                    query_data = None
+
+                results = ExecutionResults(
+                    query_data=query_data,
+                    row_count=cursor.rowcount,
+                    cursor_description=cursor.description if execution_type == MODIFY else None
+                )
+
+        return results
+
+    async def fetch_one_row(self, sql, args=None):
+        """
+        Execute a select statement and fetch a single row.
+        """
+        return await self._execute(sql, args, FETCH_ONE)
+
+    async def fetch_all_rows(self, sql, args=None):
+        """
+        Execute a select statement and fetch all rows
+        """
+        return await self._execute(sql, args, FETCH_ALL)
+
+    async def modify_rows(self, sql, args=None):
+        """
+        Execute an insert, update or delete statement.
+        """
+        return await self._execute(sql, args, MODIFY)
+
+
+async def async_connect_to_db(db_name, user_name, env=None):
+    """
+    Convenience function returning an AsyncSqlExecuter bound to a shared async pool.
+
+    :param db_name: string representing the name of the database
+    :param user_name: string representing the user connecting to the database
+    :param env: optional environment override, defaults to the ENV environment variable
+    :return: AsyncSqlExecuter object for interacting with the database
+    """
+    db_connector = PostgresDbConnector(db_name, user_name, env)
+    connection_pool = await _get_async_pool(db_connector.pool_key, db_connector.connection_alias)
+
+    return AsyncSqlExecuter(connection_pool)
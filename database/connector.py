@@ -1,50 +1,244 @@
 """
 Library for connecting to databases used at Farmobile
 """
+from collections import deque
+from functools import lru_cache
 from os import environ
+from sys import intern
+from threading import Lock, Thread
+from time import time, sleep
 
 from psycopg2 import connect, extras
+from psycopg2.extensions import TRANSACTION_STATUS_IDLE, TRANSACTION_STATUS_UNKNOWN
+from psycopg2.pool import ThreadedConnectionPool
+
+# Pool sizing can be tuned per deployment without a code change
+POOL_MIN_CONNECTIONS = int(environ.get('PG_POOL_MIN_CONNECTIONS', 1))
+POOL_MAX_CONNECTIONS = int(environ.get('PG_POOL_MAX_CONNECTIONS', 10))
+POOL_IDLE_TTL = int(environ.get('PG_POOL_IDLE_TTL', 30))
+
+# Pool flavors accepted by connect/connect_to_db
+POOL_FIXED = 'fixed'
+POOL_CACHING = 'caching'
+
+# Resolved once at import so every constructor call avoids an environ lookup;
+# an explicit env argument to PostgresDbConnector still takes precedence
+DB_ENVIRONMENT = environ.get('ENV')
+
+# Directory holding the postgres UNIX socket, used when connecting over a socket
+# instead of TCP loopback
+DEFAULT_SOCKET_DIR = environ.get('PG_SOCKET_DIR', '/var/run/postgresql')
+
+# Environment whose databases are assumed to live on the same host as the caller
+LOCAL_ENVIRONMENT = 'local'
+
+_POOLS = {}
+_POOLS_LOCK = Lock()
 
 
 class MissingEnvironmentError(Exception):
     pass
 
 
+@lru_cache(maxsize=128)
+def _connection_alias(db_name, user_name, environment, socket_dir=None):
+    """
+    Build (and memoize) the pg_service connection alias for a set of credentials.
+
+    The same credentials repeat on hot paths once pooling is enabled, so the format
+    call only runs once per distinct combination.  The result is interned so the
+    string comparisons inside the pool key are pointer comparisons.
+
+    :param db_name: string representing the name of the database
+    :param user_name: string representing the name of the database user
+    :param environment: string representing the deployment environment
+    :param socket_dir: optional UNIX socket directory overriding the service host
+    :return: the pg_service connection string
+    """
+    connection_alias = "service={db_name}:{environment} user={user_name}".format(
+        user_name=user_name, db_name=db_name, environment=environment
+    )
+    if socket_dir is not None:
+        connection_alias += " host={socket_dir}".format(socket_dir=socket_dir)
+
+    return intern(connection_alias)
+
+
+class CachingConnectionPool(object):
+    """
+    A connection pool that keeps returned connections warm for a limited time.
+
+    Unlike the fixed-size psycopg2 pools, which close excess connections as soon as
+    they are returned, this pool parks returned connections for up to idle_ttl seconds
+    so that bursty workloads reuse a warm connection instead of reconnecting.  A daemon
+    thread reaps connections that sit idle past the TTL.
+    """
+    def __init__(self, connection_alias, idle_ttl=POOL_IDLE_TTL):
+        """
+        Constructor
+
+        :param connection_alias: pg_service connection string used to open new connections
+        :param idle_ttl: seconds a returned connection may sit idle before being closed
+        """
+        self.connection_alias = connection_alias
+        self.idle_ttl = idle_ttl
+        self._idle = deque()
+        self._lock = Lock()
+        self._reaper = Thread(target=self._reap_idle_connections, daemon=True)
+        self._reaper.start()
+
+    def getconn(self):
+        """
+        Check out a connection, reusing the most recently returned one when possible.
+
+        :return: a psycopg2 connection object
+        """
+        with self._lock:
+            while self._idle:
+                db_connection, _ = self._idle.pop()
+                if db_connection.closed == 0:
+                    return db_connection
+
+        return connect(self.connection_alias)
+
+    def putconn(self, db_connection):
+        """
+        Return a connection to the pool, keeping it warm until the idle TTL expires.
+
+        Mirrors the psycopg2 pools: a connection returned mid-transaction is rolled
+        back and one in an unknown state is closed, so the next checkout never
+        inherits a half-finished transaction.
+
+        :param db_connection: the connection previously returned by getconn
+        """
+        if db_connection.closed != 0:
+            return
+
+        transaction_status = db_connection.info.transaction_status
+        if transaction_status == TRANSACTION_STATUS_UNKNOWN:
+            db_connection.close()
+            return
+        if transaction_status != TRANSACTION_STATUS_IDLE:
+            db_connection.rollback()
+
+        with self._lock:
+            self._idle.append((db_connection, time()))
+
+    def _reap_idle_connections(self):
+        while True:
+            sleep(self.idle_ttl)
+            cutoff = time() - self.idle_ttl
+            with self._lock:
+                while self._idle and self._idle[0][1] < cutoff:
+                    db_connection, _ = self._idle.popleft()
+                    try:
+                        db_connection.close()
+                    except Exception:
+                        pass
+
+
+def _get_pool(pool_key, connection_alias, pool_type=POOL_FIXED, idle_ttl=POOL_IDLE_TTL):
+    """
+    Retrieve (or lazily create) the shared connection pool for a set of credentials.
+
+    Pools are shared at the module level so every connector built with the same database,
+    user and environment reuses warm connections instead of paying the TCP/TLS/auth
+    handshake on each connect.
+
+    :param pool_key: tuple of (db_name, user_name, environment) identifying the pool
+    :param connection_alias: pg_service connection string used to open new connections
+    :param pool_type: POOL_FIXED for a ThreadedConnectionPool, POOL_CACHING for a
+        CachingConnectionPool that keeps idle connections warm
+    :param idle_ttl: idle TTL in seconds, only used by the caching pool; caching
+        pools with different TTLs are distinct pools
+    :return: a connection pool for the given credentials
+    """
+    # fixed pools ignore idle_ttl, so they should all share one cache entry
+    cache_key = (pool_key, pool_type, idle_ttl if pool_type == POOL_CACHING else None)
+    with _POOLS_LOCK:
+        connection_pool = _POOLS.get(cache_key)
+        if connection_pool is None:
+            if pool_type == POOL_CACHING:
+                connection_pool = CachingConnectionPool(connection_alias, idle_ttl=idle_ttl)
+            else:
+                connection_pool = ThreadedConnectionPool(
+                    POOL_MIN_CONNECTIONS, POOL_MAX_CONNECTIONS, connection_alias
+                )
+            _POOLS[cache_key] = connection_pool
+
+    return connection_pool
+
+
 class PostgresDbConnector(object):
     """
     Connect to a Postgres database using psycopg
 
     In an effort to obfuscate database connection credentials, this class requires implementation
     of the pgpass and pg_service configuration files on any server that uses it.
+
+    Connections are checked out of a shared module-level pool keyed on the database name,
+    user name and environment, so repeated connects are a pool checkout rather than a
+    fresh libpq connection.
     """
-    def __init__(self, db_name, user_name, env=None, auto_commit=True):
+    __slots__ = ('db_environment', 'connection_alias', 'auto_commit', 'pool_key',
+                 'connection_pool')
+
+    def __init__(self, db_name, user_name, env=None, auto_commit=True, use_socket=False,
+                 socket_dir=None):
         """
         Constructor
 
         :param db_name: string representing the name of the database
         :param user_name: string representing the name of the database user
+        :param use_socket: connect over the postgres UNIX socket instead of TCP;
+            implied when the environment is 'local', where the database is on-host
+            and the socket skips the TCP/TLS stack entirely
+        :param socket_dir: directory holding the UNIX socket, defaulting to
+            PG_SOCKET_DIR or /var/run/postgresql
         """
 
         if env is None:
-            try:
-                self.db_environment = environ['ENV']
-            except KeyError:
+            if DB_ENVIRONMENT is None:
                 raise MissingEnvironmentError("No ENV environment variable found")
+            self.db_environment = DB_ENVIRONMENT
         else:
             self.db_environment = env
 
-        self.connection_alias = "service={db_name}:{environment} user={user_name}".format(
-            user_name=user_name, db_name=db_name, environment=self.db_environment
+        if use_socket or self.db_environment == LOCAL_ENVIRONMENT:
+            socket_dir = socket_dir or DEFAULT_SOCKET_DIR
+        else:
+            socket_dir = None
+
+        self.connection_alias = _connection_alias(
+            db_name, user_name, self.db_environment, socket_dir=socket_dir
         )
         self.auto_commit = auto_commit
+        self.pool_key = (db_name, user_name, self.db_environment, socket_dir)
+        self.connection_pool = None
 
-    def connect(self, cursor_factory=extras.NamedTupleCursor):
+    def connect(self, cursor_factory=extras.NamedTupleCursor, pool=POOL_FIXED,
+                idle_ttl=POOL_IDLE_TTL):
         """
         Standard function to connect to a Farmobile database
 
-        :return: A psycopg2 connection object
+        :param cursor_factory: psycopg2 cursor factory applied to the connection
+        :param pool: POOL_FIXED or POOL_CACHING, selecting the shared pool flavor
+        :param idle_ttl: seconds the caching pool keeps idle connections warm
+        :return: A psycopg2 connection object checked out of the shared pool
         """
-        db_connection = connect(self.connection_alias, cursor_factory=cursor_factory)
+        self.connection_pool = _get_pool(
+            self.pool_key, self.connection_alias, pool_type=pool, idle_ttl=idle_ttl
+        )
+        db_connection = self.connection_pool.getconn()
+        db_connection.cursor_factory = cursor_factory
         db_connection.autocommit = self.auto_commit
 
         return db_connection
+
+    def disconnect(self, db_connection):
+        """
+        Return a connection to the shared pool so it can be reused.
+
+        :param db_connection: the connection previously returned by connect
+        """
+        self.connection_pool.putconn(db_connection)
@@ -4,34 +4,114 @@ Provide a set of methods that will eliminate the boilerplate code needed to make
 Example usage:
     from farmobile.database import SqlExecuter
     sql_executer = SqlExecuter(<database connection object>)
-    sql_executer.statement = "select column_a from table where column_b = %(column_b)s"
-    sql_executer.arguments = dict(column_b='foo')
-    sql_executer.get_all_rows()
-    for row in sql_executer.result:
+    results = sql_executer.fetch_all_rows(
+        "select column_a from table where column_b = %(column_b)s", dict(column_b='foo')
+    )
+    for row in results.query_data:
         <do something>
 
 """
+import re
 from collections import namedtuple
-from logging import getLogger
+from functools import lru_cache
+from hashlib import blake2b, blake2s
+from importlib.resources import files
+from io import StringIO
+from itertools import chain, count
+from logging import DEBUG, getLogger
+from pandas import read_csv
 from pandas.io import sql as psql
+from psycopg2 import Error as Psycopg2Error
+from psycopg2.errors import DuplicatePreparedStatement
+from psycopg2.extras import execute_values
 
-from pkg_resources import resource_string
-
-from .connector import PostgresDbConnector
+from .connector import POOL_FIXED, POOL_IDLE_TTL, PostgresDbConnector
 
 # Execution types
 FETCH_ONE = 'fetchone'
 FETCH_ALL = 'fetchall'
 MODIFY = 'modify'
 
+# Bytes read from a dump file per syscall/copy_expert read during COPY loads
+COPY_BUFFER_SIZE = 1 << 20
+
 DJANGO_DATABASE_WRAPPER = 'django.db.backends.postgresql_psycopg2.base.DatabaseWrapper'
 DJANGO_DEFAULT_CONNECTION_PROXY = 'django.db.DefaultConnectionProxy'
 
 _log = getLogger(__name__)
 
+# Matches the psycopg2 placeholder styles: %(name)s and %s
+_PLACEHOLDER_PATTERN = re.compile(r'%\((\w+)\)s|%s')
+
+# Sequence for generated server-side cursor names, so overlapping fetch_all calls on
+# one connection never collide on a name
+_fetch_all_cursor_sequence = count(1)
+
 ExecutionResults = namedtuple('ExecutionResults', ['query_data', 'cursor_description', 'row_count'])
 
 
+@lru_cache(maxsize=8)
+def _is_django_connection(connection_type):
+    """
+    Determine (and memoize) whether a connection type is django-flavored.
+
+    Keyed on the type object itself, so the string formatting and substring scans run
+    once per connection class rather than once per SqlExecuter construction.
+
+    :param connection_type: the type object of a database connection
+    :return: True if the type belongs to django's database wrapper machinery
+    """
+    type_name = '{}.{}'.format(connection_type.__module__, connection_type.__qualname__)
+
+    return (
+        DJANGO_DATABASE_WRAPPER in type_name or
+        DJANGO_DEFAULT_CONNECTION_PROXY in type_name
+    )
+
+
+@lru_cache(maxsize=1024)
+def _load_sql(package, resource_path):
+    """
+    Read (and memoize) a SQL statement from a packaged .sql file.
+
+    Resource lookups stat the filesystem on every read, so steady-state query
+    dispatch should only pay that cost once per file.
+
+    :param package: the package containing the sql directory
+    :param resource_path: path of the .sql file relative to the package
+    :return: string representing the SQL to be executed
+    """
+    return files(package).joinpath(resource_path).read_text()
+
+
+@lru_cache(maxsize=256)
+def _result_class(column_names):
+    """
+    Build (and memoize) the namedtuple class for a tuple of result column names.
+
+    namedtuple() execs generated source on every call, so caching the class by the
+    column-name tuple means repeated queries with identical shapes reuse one class.
+
+    :param column_names: tuple of column name strings from a cursor description
+    :return: a namedtuple class with the given fields
+    """
+    return namedtuple('Result', column_names)
+
+
+def _build_result(result_class, query_data):
+    """
+    Construct result namedtuples from raw query data using a prebuilt class.
+    """
+    if query_data is None:
+        converted_result = None
+    elif isinstance(query_data, list):
+        converted_result = list(map(result_class._make, query_data))
+    else:
+        converted_result = result_class._make(query_data)
+
+    return converted_result
+
+
 class SqlExecuter(object):
     """
     A set of convenience methods for commonly used database activities.
@@ -41,24 +121,100 @@ class SqlExecuter(object):
     or altering data.
 
     """
+    __slots__ = ('db_connection', 'connection_pool', 'cache', 'is_django_connection',
+                 '_prepared', '_last_description', '_last_result_class')
+
     sql_location = 'sql/{file_name}'
 
-    def __init__(self, db_connection):
+    # Rows fetched per round-trip when materializing a full result set; callers with
+    # unusually wide or narrow rows can tune this per workload
+    itersize = 10000
+
+    # When True, parameterized statements executed through _execute are PREPAREd once
+    # per connection and re-issued via EXECUTE, skipping the server-side parse/plan
+    # phase on repeats; statements that cannot be rewritten safely fall back silently.
+    # Only applies on autocommit connections, where a refused PREPARE cannot abort an
+    # open transaction
+    use_prepared_statements = True
+
+    def __init__(self, db_connection, connection_pool=None, cache=None):
+        """
+        Constructor
+
+        :param db_connection: a psycopg2 (or django) database connection object
+        :param connection_pool: optional pool the connection is returned to on close
+        :param cache: optional mutable mapping (e.g. a cachetools.TTLCache) used to
+            cache read results keyed on the sql text and arguments; writes issued
+            through modify_rows clear it to keep cached reads consistent
+        """
         self.db_connection = db_connection
-        connection_type = str(type(self.db_connection))
-        self.is_django_connection = (
-            DJANGO_DATABASE_WRAPPER in connection_type or
-            DJANGO_DEFAULT_CONNECTION_PROXY in connection_type
-        )
+        self.connection_pool = connection_pool
+        self.cache = cache
+        self.is_django_connection = _is_django_connection(type(db_connection))
+        # sql text -> (execute_sql, param_order) once PREPAREd on this connection, or
+        # None for statements that proved unpreparable.  The server session can
+        # outlive this dict when the connection is pooled; statement names hash the
+        # sql text, so a name already present in the session is simply reused
+        self._prepared = {}
+        # last-seen cursor description and its result class, so back-to-back queries
+        # with the same shape skip the per-column name loop entirely
+        self._last_description = None
+        self._last_result_class = None
+
+    def close(self):
+        """
+        Release the underlying database connection.
 
-    def get_dataframe(self, sql, args=None):
-        _log.debug("""executing cursor to dataframe""")
-        if args:
-            _log.debug("""sql to be executed: {}""".format(sql%(args)))
+        If the connection came from a connection pool it is returned to the pool for
+        reuse; otherwise it is closed outright.
+        """
+        if self.connection_pool is not None:
+            self.connection_pool.putconn(self.db_connection)
         else:
-            _log.debug("""sql to be executed: {}""".format(sql))
+            self.db_connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def get_dataframe(self, sql, args=None, via_copy=False):
+        """
+        Execute a select statement and return the result set as a DataFrame.
+
+        By default the result is built by read_sql, which preserves column dtypes
+        (bools, timestamps, None vs empty string).  Callers pulling large result sets
+        on a psycopg2 connection can pass via_copy=True to stream the rows out with
+        COPY ... TO STDOUT into pandas' C csv reader instead, which skips read_sql's
+        row-by-row Python object construction but round-trips values through CSV text:
+        booleans come back as 't'/'f' strings, timestamps as strings, and NULLs as
+        NaN.  Django connections always use read_sql since their cursors do not
+        expose copy_expert.
+
+        :param via_copy: trade dtype fidelity for throughput on large result sets
+        """
+        if _log.isEnabledFor(DEBUG):
+            _log.debug("""executing cursor to dataframe""")
+            if args:
+                _log.debug("""sql to be executed: {}""".format(sql%(args)))
+            else:
+                _log.debug("""sql to be executed: {}""".format(sql))
+
+        if not via_copy or self.is_django_connection:
+            return psql.read_sql(sql, con=self.db_connection, params=args)
 
-        return psql.read_sql(sql, con=self.db_connection, params=args)
+        with self.db_connection.cursor() as cursor:
+            if args:
+                sql = cursor.mogrify(sql, args).decode()
+            copy_buffer = StringIO()
+            cursor.copy_expert(
+                "COPY ({sql}) TO STDOUT WITH CSV HEADER".format(sql=sql.rstrip('; \n')),
+                copy_buffer
+            )
+            copy_buffer.seek(0)
+
+        return read_csv(copy_buffer)
 
     def get_sql_from_file(self, module, sql_filename):
         """
@@ -67,26 +223,125 @@ class SqlExecuter(object):
         Assumes that each python package has an "sql" directory containing .sql files that are
         used by the Python modules in said package.
 
+        The file contents are cached per (package, file) pair, so repeated dispatch of
+        the same statement does not re-read the filesystem.
+
         :param module: the __name__ of the module retrieving the SQL
         :param sql_filename: string representig the .sql file containing the SQL statement
         :return: string representing the SQL to be executed.
         """
         package = module.rpartition('.')[0]
-        return resource_string(package, self.sql_location.format(file_name=sql_filename))
+        return _load_sql(package, self.sql_location.format(file_name=sql_filename))
+
+    @staticmethod
+    def _compile_prepared(sql, args):
+        """
+        Rewrite a parameterized statement into its PREPARE/EXECUTE form.
+
+        Returns (statement_name, prepare_sql, execute_sql, param_order) where
+        param_order is the tuple of argument names in $n order for dict arguments, or
+        None for sequence arguments.  Returns None when the statement cannot be
+        rewritten safely (no parameters, mixed placeholder styles, or stray % tokens
+        such as LIKE patterns).
+        """
+        uses_dict = isinstance(args, dict)
+        name_indexes = {}
+        param_order = []
+        position_count = [0]
+
+        def replace_placeholder(match):
+            parameter_name = match.group(1)
+            if uses_dict:
+                if parameter_name is None:
+                    raise ValueError('mixed placeholder styles')
+                if parameter_name not in name_indexes:
+                    name_indexes[parameter_name] = len(name_indexes) + 1
+                    param_order.append(parameter_name)
+                return '${}'.format(name_indexes[parameter_name])
+
+            if parameter_name is not None:
+                raise ValueError('mixed placeholder styles')
+            position_count[0] += 1
+            return '${}'.format(position_count[0])
+
+        try:
+            prepared_sql = _PLACEHOLDER_PATTERN.sub(replace_placeholder, sql)
+        except ValueError:
+            return None
+
+        parameter_count = len(param_order) if uses_dict else position_count[0]
+        if parameter_count == 0 or '%' in prepared_sql:
+            return None
+
+        statement_name = 'pg_service_{}'.format(blake2s(sql.encode()).hexdigest()[:16])
+        prepare_sql = 'PREPARE {} AS {}'.format(statement_name, prepared_sql.rstrip('; \n'))
+        execute_sql = 'EXECUTE {} ({})'.format(
+            statement_name, ', '.join(['%s'] * parameter_count)
+        )
+
+        return statement_name, prepare_sql, execute_sql, tuple(param_order) if uses_dict else None
+
+    def _cursor_execute(self, cursor, sql, args):
+        """
+        Execute a statement, reusing a server-side prepared statement when possible.
+
+        The first execution of a preparable statement issues PREPARE; repeats issue
+        EXECUTE, which skips the server's parse/plan phase.  Statements without
+        arguments, django connections, and unpreparable statements execute directly.
+        Preparation is only attempted on autocommit connections: inside an explicit
+        transaction a refused PREPARE would abort the caller's in-flight work.
+        """
+        if args is None:
+            # calling execute without args at all skips psycopg2's parameter
+            # substitution path entirely
+            cursor.execute(sql)
+            return
+
+        if (
+            not self.use_prepared_statements or
+            self.is_django_connection or
+            not self.db_connection.autocommit
+        ):
+            cursor.execute(sql, args)
+            return
+
+        prepared = self._prepared.get(sql, False)
+        if prepared is False:
+            compiled = self._compile_prepared(sql, args)
+            if compiled is None:
+                prepared = None
+            else:
+                _, prepare_sql, execute_sql, param_order = compiled
+                try:
+                    cursor.execute(prepare_sql)
+                except DuplicatePreparedStatement:
+                    # a previous executer on this pooled connection already prepared
+                    # this statement; the name hashes the sql text, so it is ours
+                    prepared = (execute_sql, param_order)
+                except Psycopg2Error:
+                    prepared = None
+                else:
+                    prepared = (execute_sql, param_order)
+            self._prepared[sql] = prepared
+
+        if prepared is None:
+            cursor.execute(sql, args)
+        else:
+            execute_sql, param_order = prepared
+            if param_order is None:
+                cursor.execute(execute_sql, args)
+            else:
+                cursor.execute(execute_sql, tuple(args[name] for name in param_order))
 
     def _execute(self, sql, args, execution_type):
         """
         Execute a select statement and fetch a single row.
         """
         with self.db_connection.cursor() as cursor:
-            _log.debug(cursor.mogrify(sql, args))
-            cursor.execute(sql, args)
-            if execution_type == FETCH_ONE:
-                query_data = cursor.fetchone()
-            elif execution_type == FETCH_ALL:
-                query_data = cursor.fetchall()
-            else:
-                query_data = None
+            if _log.isEnabledFor(DEBUG):
+                _log.debug(sql if args is None else cursor.mogrify(sql, args))
+            self._cursor_execute(cursor, sql, args)
+            query_data = self._FETCH_DISPATCH[execution_type](self, cursor)
 
             # HACK ALERT!!!    HACK ALERT!!!    HACK ALERT!!!
             # While the postgres backend used by django is implemented with psycopg,
@@ -94,7 +349,7 @@ class SqlExecuter(object):
             # accessing the database via django, this hack will use the connection type to
             # determine if the connection is django-flavored without implementing django.
             if self.is_django_connection and query_data is not None:
-                query_data = self.convert_result_to_namedtuple(cursor.description, query_data)
+                query_data = self._convert_result(cursor.description, query_data)
 
             results = ExecutionResults(
                 query_data=query_data,
@@ -105,64 +360,247 @@ class SqlExecuter(object):
         return results
 
     @staticmethod
-    def convert_result_to_namedtuple(cursor_description, query_data):
-        namedtuple_result = namedtuple('Result', [col.name for col in cursor_description])
-        if query_data is None:
-            converted_result = None
-        elif isinstance(query_data, list):
-            converted_result = [namedtuple_result(*row) for row in query_data]
+    def _cache_key(sql, args, execution_type):
+        """
+        Build a stable cache key for a read from its sql text and arguments.
+        """
+        if isinstance(args, dict):
+            args_repr = repr(sorted(args.items()))
         else:
-            converted_result = namedtuple_result(*query_data)
+            args_repr = repr(args)
 
-        return converted_result
+        return blake2b(
+            '{}|{}|{}'.format(execution_type, sql, args_repr).encode()
+        ).hexdigest()
+
+    def _execute_cached(self, sql, args, execution_type):
+        """
+        Execute a read, consulting the result cache first when one is configured.
+        """
+        if self.cache is None:
+            return self._execute(sql, args, execution_type)
+
+        cache_key = self._cache_key(sql, args, execution_type)
+        try:
+            return self.cache[cache_key]
+        except KeyError:
+            pass
+
+        results = self._execute(sql, args, execution_type)
+        self.cache[cache_key] = results
+
+        return results
+
+    def _fetch_all_batches(self, cursor):
+        """
+        Materialize a full result set in itersize batches rather than one fetchall.
+
+        Fetching in batches avoids fetchall's per-row append loop and keeps list
+        growth to one extend call per batch.
+        """
+        rows = []
+        rows_extend = rows.extend
+        while True:
+            batch = cursor.fetchmany(self.itersize)
+            if not batch:
+                break
+            rows_extend(batch)
+
+        return rows
+
+    # Pre-bound per-execution-type fetch strategies; a single dict lookup in _execute
+    # replaces the string comparisons and attribute resolution per call
+    _FETCH_DISPATCH = {
+        FETCH_ONE: lambda self, cursor: cursor.fetchone(),
+        FETCH_ALL: _fetch_all_batches,
+        MODIFY: lambda self, cursor: None,
+    }
+
+    def _convert_result(self, cursor_description, query_data):
+        """
+        Convert raw query data to namedtuples, fast-pathing repeated descriptions.
+
+        When the cursor hands back the very same description object as the previous
+        query (repeated identical selects on a reused cursor), the cached result class
+        is used directly without re-reading the column names.
+        """
+        if cursor_description is self._last_description:
+            result_class = self._last_result_class
+        else:
+            result_class = _result_class(tuple(col.name for col in cursor_description))
+            self._last_description = cursor_description
+            self._last_result_class = result_class
+
+        return _build_result(result_class, query_data)
+
+    @staticmethod
+    def convert_result_to_namedtuple(cursor_description, query_data):
+        namedtuple_result = _result_class(tuple(col.name for col in cursor_description))
+        return _build_result(namedtuple_result, query_data)
 
     def fetch_one_row(self, sql, args=None):
         """
         Execute a select statement and fetch a single row.
         """
-        return self._execute(sql, args, FETCH_ONE)
+        return self._execute_cached(sql, args, FETCH_ONE)
 
     def fetch_all_rows(self, sql, args=None):
         """
         Execute a select statement and fetch all rows
         """
-        return self._execute(sql, args, FETCH_ALL)
+        return self._execute_cached(sql, args, FETCH_ALL)
+
+    def fetch_all(self, sql, args=None, large=False, cursor_name=None):
+        """
+        Execute a select statement, choosing the cursor strategy from a size hint.
+
+        Server-side (named) cursors keep huge result sets out of client memory but are
+        markedly slower on small ones, so bounded/small queries should leave large as
+        False and get the client-side fetch; queries expected to return a large or
+        unbounded number of rows should pass large=True to stream rows instead.
+
+        :param sql: A string representing the sql statement to be executed
+        :param args: A dictionary or sequence representing the arguments passed to the sql statement
+        :param large: when True, stream rows through a server-side cursor
+        :param cursor_name: name used for the server-side cursor when large is True,
+            defaulting to a generated per-call unique name
+        :return: ExecutionResults when large is False, otherwise a row generator
+        """
+        if not large:
+            return self._execute_cached(sql, args, FETCH_ALL)
+
+        if cursor_name is None:
+            cursor_name = 'fetch_all_large_{}'.format(next(_fetch_all_cursor_sequence))
+
+        return self.fetch_all_server_side(cursor_name, sql, args, arraysize=self.itersize)
 
     def modify_rows(self, sql, args=None):
         """
         Execute an insert, update or delete statement.
+
+        Clears the result cache, if one is configured, so cached reads cannot serve
+        data that the write just changed.
         """
+        if self.cache is not None:
+            self.cache.clear()
+
         return self._execute(sql, args, MODIFY)
 
-    def fetch_all_server_side(self, cursor_name, sql, args):
+    def modify_rows_fast(self, sql, args=None):
         """
-        Generator function that executes a server side cursor.
+        Execute an insert, update or delete statement and return only the row count.
+
+        Skips the ExecutionResults wrapper that modify_rows allocates per call, which
+        adds up in tight bulk-write loops where callers only consume the row count.
+
+        :return: integer number of rows affected
+        """
+        if self.cache is not None:
+            self.cache.clear()
+
+        with self.db_connection.cursor() as cursor:
+            if _log.isEnabledFor(DEBUG):
+                _log.debug(sql if args is None else cursor.mogrify(sql, args))
+            if args is None:
+                cursor.execute(sql)
+            else:
+                cursor.execute(sql, args)
+            row_count = cursor.rowcount
+
+        return row_count
+
+    def modify_many(self, sql, rows, page_size=1000):
+        """
+        Execute an insert, update or delete statement against many rows at once.
+
+        The statement must contain a single VALUES %s placeholder, which
+        psycopg2's execute_values rewrites into a multi-row VALUES list, collapsing
+        one round-trip per row into one per page.
+
+        :param sql: A string containing a VALUES %s placeholder, e.g.
+            "insert into table (column_a, column_b) values %s"
+        :param rows: A sequence of tuples supplying the values for each row
+        :param page_size: number of rows folded into each statement
+        """
+        if self.cache is not None:
+            self.cache.clear()
+
+        with self.db_connection.cursor() as cursor:
+            execute_values(cursor, sql, rows, page_size=page_size)
+            results = ExecutionResults(
+                query_data=None, cursor_description=None, row_count=cursor.rowcount
+            )
+
+        return results
+
+    def fetch_batches_server_side(self, cursor_name, sql, args, arraysize=10000):
+        """
+        Generator function that executes a server side cursor and yields row batches.
+
+        Yielding the fetched batch itself keeps the protocol-level batching visible to
+        consumers, which skips the per-row generator overhead of fetch_all_server_side
+        when the consumer can process a list of rows at a time.
 
         :param cursor_name: A string representing the name passed to the server side cursor
         :param sql: A string representing the sql statment to be executed
         :param args: A dictionary or sequence representing the arguments passed to the sql statement
+        :param arraysize: number of rows fetched from the server per round-trip
         """
         auto_commit_was_on = self.db_connection.autocommit
         self.db_connection.autocommit = False
         with self.db_connection as cxn:
             with cxn.cursor(name=cursor_name) as cursor:
-                cursor.arraysize = 4000
-                _log.debug(cursor.mogrify(sql, args))
-                cursor.execute(sql, args)
+                cursor.arraysize = arraysize
+                if _log.isEnabledFor(DEBUG):
+                    _log.debug(sql if args is None else cursor.mogrify(sql, args))
+                if args is None:
+                    cursor.execute(sql)
+                else:
+                    cursor.execute(sql, args)
                 while True:
                     result_set = cursor.fetchmany()
                     if not result_set:
                         break
-                    for row in result_set:
-                        yield row
+                    yield result_set
 
         if auto_commit_was_on:
             self.db_connection.autocommit = True
 
+    def fetch_all_server_side(self, cursor_name, sql, args, arraysize=10000):
+        """
+        Generator function that executes a server side cursor.
+
+        Thin row-by-row wrapper around fetch_batches_server_side for consumers that
+        want individual rows.
+
+        :param cursor_name: A string representing the name passed to the server side cursor
+        :param sql: A string representing the sql statment to be executed
+        :param args: A dictionary or sequence representing the arguments passed to the sql statement
+        :param arraysize: number of rows fetched from the server per round-trip
+        """
+        return chain.from_iterable(
+            self.fetch_batches_server_side(cursor_name, sql, args, arraysize=arraysize)
+        )
+
     def copy_to_table_from_file(self, sql, dump_file_path):
+        """
+        Load a table from a dump file with COPY.
+
+        The file is streamed in binary mode through a 1MB buffer, so multi-GB dumps
+        are not throttled by the default 8KB text-mode reads.
+        """
         with self.db_connection.cursor() as cursor:
-            with open(dump_file_path, 'r') as dump_file:
-                cursor.copy_expert(sql, dump_file)
+            with open(dump_file_path, 'rb', buffering=COPY_BUFFER_SIZE) as dump_file:
+                cursor.copy_expert(sql, dump_file, size=COPY_BUFFER_SIZE)
+
+    def copy_binary_from_file(self, sql, dump_file_path):
+        """
+        Load a table from a binary-format dump file with COPY.
+
+        Expects a statement of the form COPY ... FROM STDIN WITH (FORMAT BINARY) and a
+        dump produced with the same format; binary COPY skips text parsing server-side.
+        """
+        self.copy_to_table_from_file(sql, dump_file_path)
 
 
 def copy_table_to_file(db_connection, table_name, dump_file_path):
@@ -177,7 +615,8 @@ def copy_table_from_file(db_connection, table_name, dump_file_path):
                 cursor.copy_from(dump_file, table_name)
 
 
-def connect_to_db(db_name, user_name, env=None, cursor_factory=None, auto_commit=True):
+def connect_to_db(db_name, user_name, env=None, cursor_factory=None, auto_commit=True,
+                  pool=POOL_FIXED, idle_ttl=POOL_IDLE_TTL):
     """
     Convenience function to connect to a database and return a SqlExecuter object.
 
@@ -185,12 +624,16 @@ def connect_to_db(db_name, user_name, env=None, cursor_factory=None, auto_commit
     :param user_name: string representing the user connecting to the database
     :param cursor_factory: psycopg2 cursor factory object, default to NamedTupleCursor
     :param auto_commit: boolean indicating if connection will have auto commit turned on
+    :param pool: 'fixed' for a bounded pool, 'caching' to keep idle connections warm
+    :param idle_ttl: seconds the caching pool keeps idle connections before reaping
     :return: SqlExecuter object for interacting with database.
     """
     db_connector = PostgresDbConnector(db_name, user_name, env, auto_commit)
     if cursor_factory is None:
-        db_connection = db_connector.connect()
+        db_connection = db_connector.connect(pool=pool, idle_ttl=idle_ttl)
     else:
-        db_connection = db_connector.connect(cursor_factory=cursor_factory)
+        db_connection = db_connector.connect(
+            cursor_factory=cursor_factory, pool=pool, idle_ttl=idle_ttl
+        )
 
-    return SqlExecuter(db_connection)
+    return SqlExecuter(db_connection, connection_pool=db_connector.connection_pool)
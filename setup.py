@@ -9,6 +9,12 @@ setup(
 
         'pandas'
     ],
+    extras_require={
+        'test': [
+            'mock',
+            'testing.postgresql'
+        ]
+    },
     description='Python library containing logic specific to copy data, bulk insert, '
                 'pandas machine learning.'
 )
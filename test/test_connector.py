@@ -1,43 +1,85 @@
+from os import environ
+from os.path import join
+from shutil import rmtree, which
+from tempfile import mkdtemp
+from unittest import TestCase, skipUnless
+
+try:
+    import testing.postgresql
+except ImportError:
+    testing = None
+
 from psycopg2 import OperationalError
 from psycopg2.extensions import connection
-from unittest import TestCase
-
-from mock import patch
 
 from database.connector import PostgresDbConnector
 
 DEVELOPMENT_ENVIRONMENT = 'dev'
-TB_DB = 'decoded'
-DB_USER = 'thachbui'
+TEST_DB = 'test'
+DB_USER = 'postgres'
 
+SERVICE_FILE_TEMPLATE = """[{db_name}:{environment}]
+host={host}
+port={port}
+dbname={database}
+"""
 
+
+@skipUnless(testing is not None and which('initdb'),
+            'testing.postgresql or postgres server binaries are not available')
 class TestDbConnector(TestCase):
-    def test_unsupported_db_name(self):
-        with self.assertRaises(ValueError):
-            PostgresDbConnector('foo', 'foo')
+    """
+    Connector tests against an in-process ephemeral postgres cluster.
+
+    The cluster starts once per test class and every test reuses it through a
+    pg_service file pointed at the temporary instance, so the suite pays cluster
+    startup once instead of per test.
+    """
+    @classmethod
+    def setUpClass(cls):
+        cls.postgresql = testing.postgresql.Postgresql()
+        cls.service_file_dir = mkdtemp()
+        service_file_path = join(cls.service_file_dir, 'pg_service.conf')
+        with open(service_file_path, 'w') as service_file:
+            service_file.write(SERVICE_FILE_TEMPLATE.format(
+                db_name=TEST_DB, environment=DEVELOPMENT_ENVIRONMENT, **cls.postgresql.dsn()
+            ))
+        environ['PGSERVICEFILE'] = service_file_path
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.postgresql.stop()
+        rmtree(cls.service_file_dir)
+        del environ['PGSERVICEFILE']
 
     def test_connect_auto_commit(self):
-        with patch('database.connector.DB_ENVIRONMENT', DEVELOPMENT_ENVIRONMENT):
-            db_connector = PostgresDbConnector(TB_DB, DB_USER)
-            db_connection = db_connector.connect()
+        db_connector = PostgresDbConnector(TEST_DB, DB_USER, DEVELOPMENT_ENVIRONMENT)
+        db_connection = db_connector.connect()
 
         self.assertIsInstance(db_connection, connection)
-        service_parameter = 'service={}:{}'.format(TB_DB, DEVELOPMENT_ENVIRONMENT)
+        service_parameter = 'service={}:{}'.format(TEST_DB, DEVELOPMENT_ENVIRONMENT)
         self.assertIn(service_parameter, db_connector.connection_alias)
-        self.assertEquals(True, db_connection.autocommit)
+        self.assertEqual(True, db_connection.autocommit)
+        db_connector.disconnect(db_connection)
 
     def test_connect_no_auto_commit(self):
-        with patch('database.connector.DB_ENVIRONMENT', DEVELOPMENT_ENVIRONMENT):
-            db_connector = PostgresDbConnector(TB_DB, DB_USER, False)
-            db_connection = db_connector.connect()
+        db_connector = PostgresDbConnector(
+            TEST_DB, DB_USER, DEVELOPMENT_ENVIRONMENT, auto_commit=False
+        )
+        db_connection = db_connector.connect()
 
         self.assertIsInstance(db_connection, connection)
-        service_parameter = 'service={}:{}'.format(TB_DB, DEVELOPMENT_ENVIRONMENT)
+        service_parameter = 'service={}:{}'.format(TEST_DB, DEVELOPMENT_ENVIRONMENT)
         self.assertIn(service_parameter, db_connector.connection_alias)
-        self.assertEquals(False, db_connection.autocommit)
+        self.assertEqual(False, db_connection.autocommit)
+        db_connector.disconnect(db_connection)
+
+    def test_unsupported_db_name(self):
+        with self.assertRaises(OperationalError):
+            db_connector = PostgresDbConnector('foo', DB_USER, DEVELOPMENT_ENVIRONMENT)
+            db_connector.connect()
 
     def test_invalid_user(self):
-        with patch('database.connector.DB_ENVIRONMENT', DEVELOPMENT_ENVIRONMENT):
-            with self.assertRaises(OperationalError):
-                db_connector = PostgresDbConnector(TB_DB, 'foo', False)
-                db_connector.connect()
+        with self.assertRaises(OperationalError):
+            db_connector = PostgresDbConnector(TEST_DB, 'foo', DEVELOPMENT_ENVIRONMENT)
+            db_connector.connect()
@@ -0,0 +1,154 @@
+from unittest import TestCase
+
+from mock import MagicMock
+from psycopg2 import ProgrammingError
+from psycopg2.errors import DuplicatePreparedStatement
+
+from database.sql_executer import SqlExecuter
+
+
+class TestCompilePrepared(TestCase):
+    def test_dict_args(self):
+        compiled = SqlExecuter._compile_prepared(
+            'select a from t where b = %(b)s and c = %(c)s', dict(b=1, c=2)
+        )
+
+        statement_name, prepare_sql, execute_sql, param_order = compiled
+        self.assertEqual(
+            'PREPARE {} AS select a from t where b = $1 and c = $2'.format(statement_name),
+            prepare_sql
+        )
+        self.assertEqual('EXECUTE {} (%s, %s)'.format(statement_name), execute_sql)
+        self.assertEqual(('b', 'c'), param_order)
+
+    def test_repeated_named_placeholder_shares_parameter(self):
+        compiled = SqlExecuter._compile_prepared(
+            'select a from t where b = %(b)s or b2 = %(b)s', dict(b=1)
+        )
+
+        statement_name, prepare_sql, execute_sql, param_order = compiled
+        self.assertIn('b = $1 or b2 = $1', prepare_sql)
+        self.assertEqual('EXECUTE {} (%s)'.format(statement_name), execute_sql)
+        self.assertEqual(('b',), param_order)
+
+    def test_sequence_args(self):
+        compiled = SqlExecuter._compile_prepared(
+            'select a from t where b = %s and c = %s', (1, 2)
+        )
+
+        statement_name, prepare_sql, execute_sql, param_order = compiled
+        self.assertIn('b = $1 and c = $2', prepare_sql)
+        self.assertEqual('EXECUTE {} (%s, %s)'.format(statement_name), execute_sql)
+        self.assertIsNone(param_order)
+
+    def test_trailing_semicolon_stripped(self):
+        compiled = SqlExecuter._compile_prepared('select a from t where b = %(b)s;\n', dict(b=1))
+
+        _, prepare_sql, _, _ = compiled
+        self.assertTrue(prepare_sql.endswith('b = $1'))
+
+    def test_no_parameters_is_unpreparable(self):
+        self.assertIsNone(SqlExecuter._compile_prepared('select 1', ()))
+
+    def test_mixed_placeholder_styles_are_unpreparable(self):
+        self.assertIsNone(SqlExecuter._compile_prepared(
+            'select a where b = %s and c = %(c)s', dict(c=1)
+        ))
+        self.assertIsNone(SqlExecuter._compile_prepared(
+            'select a where b = %s and c = %(c)s', (1,)
+        ))
+
+    def test_stray_percent_is_unpreparable(self):
+        self.assertIsNone(SqlExecuter._compile_prepared(
+            "select a from t where b like 'x%' and c = %(c)s", dict(c=1)
+        ))
+
+    def test_percent_escape_is_unpreparable(self):
+        self.assertIsNone(SqlExecuter._compile_prepared(
+            "select a from t where b like '10%%' and c = %(c)s", dict(c=1)
+        ))
+
+
+class TestCursorExecute(TestCase):
+    def setUp(self):
+        self.db_connection = MagicMock()
+        self.db_connection.autocommit = True
+        self.cursor = MagicMock()
+        self.sql_executer = SqlExecuter(self.db_connection)
+
+    def executed_statements(self):
+        return [call.args for call in self.cursor.execute.call_args_list]
+
+    def test_no_args_executes_without_parameter_handling(self):
+        self.sql_executer._cursor_execute(self.cursor, 'select now()', None)
+
+        self.assertEqual([('select now()',)], self.executed_statements())
+
+    def test_prepares_once_then_executes(self):
+        sql = 'select a from t where b = %(b)s'
+        self.sql_executer._cursor_execute(self.cursor, sql, dict(b=1))
+        self.sql_executer._cursor_execute(self.cursor, sql, dict(b=2))
+
+        statements = self.executed_statements()
+        self.assertTrue(statements[0][0].startswith('PREPARE pg_service_'))
+        self.assertTrue(statements[1][0].startswith('EXECUTE pg_service_'))
+        self.assertEqual((1,), statements[1][1])
+        self.assertTrue(statements[2][0].startswith('EXECUTE pg_service_'))
+        self.assertEqual((2,), statements[2][1])
+
+    def test_disabled_flag_bypasses_preparation(self):
+        class UnpreparedSqlExecuter(SqlExecuter):
+            use_prepared_statements = False
+
+        sql = 'select a from t where b = %(b)s'
+        sql_executer = UnpreparedSqlExecuter(self.db_connection)
+        sql_executer._cursor_execute(self.cursor, sql, dict(b=1))
+
+        self.assertEqual([(sql, dict(b=1))], self.executed_statements())
+
+    def test_non_autocommit_connection_bypasses_preparation(self):
+        sql = 'select a from t where b = %(b)s'
+        self.db_connection.autocommit = False
+        self.sql_executer._cursor_execute(self.cursor, sql, dict(b=1))
+
+        self.assertEqual([(sql, dict(b=1))], self.executed_statements())
+
+    def test_unpreparable_sql_executes_directly(self):
+        sql = "select a from t where b like 'x%' and c = %(c)s"
+        self.sql_executer._cursor_execute(self.cursor, sql, dict(c=1))
+        self.sql_executer._cursor_execute(self.cursor, sql, dict(c=2))
+
+        self.assertEqual(
+            [(sql, dict(c=1)), (sql, dict(c=2))], self.executed_statements()
+        )
+
+    def test_refused_prepare_falls_back_without_rollback(self):
+        sql = 'select a from t where b = %(b)s'
+
+        def refuse_prepare(statement, args=None):
+            if statement.startswith('PREPARE'):
+                raise ProgrammingError()
+
+        self.cursor.execute.side_effect = refuse_prepare
+        self.sql_executer._cursor_execute(self.cursor, sql, dict(b=1))
+        self.sql_executer._cursor_execute(self.cursor, sql, dict(b=2))
+
+        statements = self.executed_statements()
+        self.assertEqual((sql, dict(b=1)), statements[1])
+        # the failure is remembered; no second PREPARE is attempted
+        self.assertEqual((sql, dict(b=2)), statements[2])
+        self.db_connection.rollback.assert_not_called()
+
+    def test_duplicate_prepare_reuses_existing_statement(self):
+        sql = 'select a from t where b = %(b)s'
+
+        def already_prepared(statement, args=None):
+            if statement.startswith('PREPARE'):
+                raise DuplicatePreparedStatement()
+
+        self.cursor.execute.side_effect = already_prepared
+        self.sql_executer._cursor_execute(self.cursor, sql, dict(b=1))
+
+        statements = self.executed_statements()
+        self.assertTrue(statements[1][0].startswith('EXECUTE pg_service_'))
+        self.assertEqual((1,), statements[1][1])